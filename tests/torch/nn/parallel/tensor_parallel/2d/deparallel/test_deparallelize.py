@@ -18,6 +18,7 @@ from transformers import (
 from oslo.torch.distributed import ParallelContext, ParallelMode
 from oslo.torch.nn.parallel.tensor_parallel import TensorParallel
 from oslo.torch.nn.parallel.utils import allocate_params
+from tests.torch.nn.parallel.tensor_parallel._utils import latency_trace
 
 
 def seed_all(seed: int = 1930):
@@ -46,16 +47,6 @@ def seed_worker(_worker_id):
 seed_all(seed=1994)
 
 
-def latency_trace(func):
-    def wrapper(*args, **kwargs):
-        start = time.time()
-        result = func(*args, **kwargs)
-        end = time.time()
-        return result, end - start
-
-    return wrapper
-
-
 @latency_trace
 def fw(func, *args, **kwargs):
     return func(*args, **kwargs).loss
@@ -129,7 +120,7 @@ optimizer_gathered = Adam(model_gathered.parameters(), lr=3e-5)
 dist.barrier()
 
 # 학습 시작
-for data in dataloader:
+for step, data in enumerate(dataloader):
     optimizer_tp.zero_grad()
     optimizer_no_tp.zero_grad()
     optimizer_gathered.zero_grad()
@@ -160,7 +151,8 @@ for data in dataloader:
     optimizer_no_tp.step()
     optimizer_gathered.step()
 
-    if dist.get_rank() == 0:
+    # 첫 스텝은 cuBLAS 초기화 등 워밍업 비용이 포함되므로 시간을 기록하지 않음
+    if dist.get_rank() == 0 and step > 0:
         wandb.log(
             {
                 "tp.forward.time:": tp_fw_time,
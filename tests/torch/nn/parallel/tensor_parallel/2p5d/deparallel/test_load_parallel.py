@@ -10,16 +10,7 @@ from transformers import AutoTokenizer, GPT2Config, GPT2LMHeadModel
 from oslo.torch.distributed import ParallelContext, ParallelMode
 from oslo.torch.nn.parallel.tensor_parallel import TensorParallel
 from oslo.torch.nn.parallel.utils import allocate_params
-
-
-def latency_trace(func):
-    def wrapper(*args, **kwargs):
-        start = time.time()
-        result = func(*args, **kwargs)
-        end = time.time()
-        return result, end - start
-
-    return wrapper
+from tests.torch.nn.parallel.tensor_parallel._utils import latency_trace
 
 
 @latency_trace
@@ -95,7 +86,7 @@ optimizer_reparallel = Adam(model_reparallel.parameters(), lr=3e-5)
 dist.barrier()
 
 # 학습 시작
-for data in dataloader:
+for step, data in enumerate(dataloader):
     optimizer_tp.zero_grad()
     optimizer_no_tp.zero_grad()
     model_reparallel.zero_grad()
@@ -126,7 +117,8 @@ for data in dataloader:
     optimizer_no_tp.step()
     optimizer_reparallel.step()
 
-    if dist.get_rank() == 0:
+    # 첫 스텝은 cuBLAS 초기화 등 워밍업 비용이 포함되므로 시간을 기록하지 않음
+    if dist.get_rank() == 0 and step > 0:
         wandb.log(
             {
                 "tp.forward.time:": tp_fw_time,
@@ -15,16 +15,7 @@ from transformers import (
 import oslo
 from oslo.torch.distributed import ParallelContext, ParallelMode
 from oslo.torch.nn.parallel.tensor_parallel import TensorParallel
-
-
-def latency_trace(func):
-    def wrapper(*args, **kwargs):
-        start = time.time()
-        result = func(*args, **kwargs)
-        end = time.time()
-        return result, end - start
-
-    return wrapper
+from tests.torch.nn.parallel.tensor_parallel._utils import latency_trace
 
 
 @latency_trace
@@ -90,7 +81,7 @@ if dist.get_rank() == 0:
 dist.barrier()
 
 # 학습 시작
-for data in dataloader:
+for step, data in enumerate(dataloader):
     optimizer_tp.zero_grad()
     optimizer_no_tp.zero_grad()
 
@@ -109,15 +100,19 @@ for data in dataloader:
     _, tp_bw_time = bw(loss_tp)
 
     if dist.get_rank() == 0:
-        wandb.log(
-            {
-                "tp_loss": loss_tp,
-                "notp_loss": loss_no_tp,
-                "tp.forward.time:": tp_fw_time,
-                "tp.backward.time:": tp_bw_time,
-                "notp.forward.time:": notp_fw_time,
-                "notp.backward.time:": notp_bw_time,
-            }
-        )
+        logs = {"tp_loss": loss_tp, "notp_loss": loss_no_tp}
+
+        # 첫 스텝은 cuBLAS 초기화 등 워밍업 비용이 포함되므로 시간을 기록하지 않음
+        if step > 0:
+            logs.update(
+                {
+                    "tp.forward.time:": tp_fw_time,
+                    "tp.backward.time:": tp_bw_time,
+                    "notp.forward.time:": notp_fw_time,
+                    "notp.backward.time:": notp_bw_time,
+                }
+            )
+
+        wandb.log(logs)
 
 dist.barrier()
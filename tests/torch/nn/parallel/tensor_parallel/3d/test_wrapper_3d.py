@@ -11,6 +11,19 @@ from transformers import AutoTokenizer, GPT2Config, GPT2LMHeadModel
 import oslo
 from oslo.torch.distributed import ParallelContext, ParallelMode
 from oslo.torch.nn.parallel.tensor_parallel import TensorParallel
+from tests.torch.nn.parallel.tensor_parallel._utils import latency_trace
+
+
+@latency_trace
+def fw(func, *args, **kwargs):
+    return func(*args, **kwargs).loss
+
+
+@latency_trace
+def bw(tensors, optimizer):
+    tensors.backward()
+    optimizer.step()
+
 
 tp_size = 8
 batch_size = 16
@@ -59,7 +72,7 @@ if dist.get_rank() == 0:
 dist.barrier()
 
 # 학습 시작
-for data in dataloader:
+for step, data in enumerate(dataloader):
     optimizer_tp.zero_grad()
     optimizer_no_tp.zero_grad()
 
@@ -71,35 +84,27 @@ for data in dataloader:
         max_length=512,
     ).to("cuda")
 
-    fw_start = time.time()
-    loss_no_tp = model_no_tp(**inputs, labels=inputs["input_ids"]).loss
-    fw_time = time.time() - fw_start
-
-    fw_start_tp = time.time()
-    loss_tp = wrapper_tp(**inputs, labels=inputs["input_ids"]).loss
-    fw_time_tp = time.time() - fw_start_tp
-
-    bw_start = time.time()
-    loss_no_tp.backward()
-    optimizer_no_tp.step()
-    bw_time = time.time() - bw_start
+    loss_no_tp, fw_time = fw(model_no_tp, **inputs, labels=inputs["input_ids"])
+    loss_tp, fw_time_tp = fw(wrapper_tp, **inputs, labels=inputs["input_ids"])
 
-    bw_start_tp = time.time()
-    loss_tp.backward()
-    optimizer_tp.step()
-    bw_time_tp = time.time() - bw_start_tp
+    _, bw_time = bw(loss_no_tp, optimizer_no_tp)
+    _, bw_time_tp = bw(loss_tp, optimizer_tp)
 
     if dist.get_rank() == 0:
         print(f"[tp/notp loss]: {loss_tp:.4f}, {loss_no_tp:.4f}")
-        wandb.log(
-            {
-                "tp_loss": loss_tp,
-                "notp_loss": loss_no_tp,
-                "tp_fw_time": fw_time_tp,
-                "notp_fw_time": fw_time,
-                "tp_bw_time": bw_time_tp,
-                "notp_bw_time": bw_time,
-            }
-        )
+        logs = {"tp_loss": loss_tp, "notp_loss": loss_no_tp}
+
+        # 첫 스텝은 cuBLAS 초기화 등 워밍업 비용이 포함되므로 시간을 기록하지 않음
+        if step > 0:
+            logs.update(
+                {
+                    "tp_fw_time": fw_time_tp,
+                    "notp_fw_time": fw_time,
+                    "tp_bw_time": bw_time_tp,
+                    "notp_bw_time": bw_time,
+                }
+            )
+
+        wandb.log(logs)
 
 dist.barrier()
@@ -0,0 +1,14 @@
+import torch
+
+
+def latency_trace(func):
+    def wrapper(*args, **kwargs):
+        start = torch.cuda.Event(enable_timing=True)
+        end = torch.cuda.Event(enable_timing=True)
+        start.record()
+        result = func(*args, **kwargs)
+        end.record()
+        torch.cuda.synchronize()
+        return result, start.elapsed_time(end) / 1000
+
+    return wrapper